@@ -1,4 +1,10 @@
 // Export the interface
+export 'src/fipers_codec.dart'
+    show
+        FipersBufferReserver,
+        FipersCodec,
+        FipersJsonCodec,
+        FipersStringCodec;
 export 'src/fipers_interface.dart' show Fipers;
 
 // Import native implementation
@@ -0,0 +1,85 @@
+import 'dart:convert';
+import 'dart:typed_data';
+
+/// Reserves a writable buffer of at least [maxLength] bytes.
+///
+/// The native storage backs the returned view with native memory, so bytes
+/// written into it are handed to the native layer without a copy.
+typedef FipersBufferReserver = Uint8List Function(int maxLength);
+
+/// {@template fipers_codec}
+/// Converts values of type [T] to and from the bytes stored by Fipers.
+///
+/// Codecs write into the buffer handed out by the storage and read straight
+/// from the decrypted native buffer, so decoding never copies the bytes into
+/// an intermediate `Uint8List`.
+/// {@endtemplate}
+abstract class FipersCodec<T> {
+  /// {@macro fipers_codec}
+  const FipersCodec();
+
+  /// Encodes [value] into a buffer obtained from [reserve].
+  ///
+  /// [reserve] must be called exactly once with an upper bound of the
+  /// encoded size. Returns the number of bytes actually written, which must
+  /// be greater than zero and not exceed the reserved length.
+  int encode(T value, FipersBufferReserver reserve);
+
+  /// Decodes a value from [bytes].
+  ///
+  /// [bytes] is a view over native memory that is released as soon as this
+  /// method returns, so it must not be retained.
+  T decode(Uint8List bytes);
+}
+
+/// {@template fipers_string_codec}
+/// UTF-8 codec for [String] values.
+///
+/// ASCII text is written straight into the reserved buffer. Other text is
+/// encoded with [utf8] and copied in once.
+/// {@endtemplate}
+class FipersStringCodec extends FipersCodec<String> {
+  /// {@macro fipers_string_codec}
+  const FipersStringCodec();
+
+  @override
+  int encode(String value, FipersBufferReserver reserve) {
+    final length = value.length;
+    for (var i = 0; i < length; i++) {
+      if (value.codeUnitAt(i) >= 0x80) {
+        // Multi-byte text: built-in encoder plus one copy
+        final bytes = utf8.encode(value);
+        reserve(bytes.length).setAll(0, bytes);
+        return bytes.length;
+      }
+    }
+
+    // ASCII: one byte per code unit, written straight into the buffer
+    final target = reserve(length);
+    for (var i = 0; i < length; i++) {
+      target[i] = value.codeUnitAt(i);
+    }
+    return length;
+  }
+
+  @override
+  String decode(Uint8List bytes) => utf8.decode(bytes);
+}
+
+/// {@template fipers_json_codec}
+/// JSON codec for values accepted by [jsonEncode].
+/// {@endtemplate}
+class FipersJsonCodec extends FipersCodec<Object?> {
+  /// {@macro fipers_json_codec}
+  const FipersJsonCodec();
+
+  static final _decoder = const Utf8Decoder().fuse(const JsonDecoder());
+
+  @override
+  int encode(Object? value, FipersBufferReserver reserve) {
+    return const FipersStringCodec().encode(jsonEncode(value), reserve);
+  }
+
+  @override
+  Object? decode(Uint8List bytes) => _decoder.convert(bytes);
+}
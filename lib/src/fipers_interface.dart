@@ -1,5 +1,7 @@
 import 'dart:typed_data';
 
+import 'fipers_codec.dart';
+
 /// {@template fipers_interface}
 /// Abstract interface for Fipers encrypted persistent storage.
 ///
@@ -20,6 +22,7 @@ abstract class Fipers {
   ///
   /// The [data] will be encrypted before being stored.
   ///
+  /// Throws an [ArgumentError] if [data] is empty.
   /// Throws an exception if the storage is not initialized or if the operation fails.
   Future<void> put(String key, Uint8List data);
 
@@ -30,6 +33,61 @@ abstract class Fipers {
   /// Throws an exception if the storage is not initialized or if decryption fails.
   Future<Uint8List?> get(String key);
 
+  /// Stores [value] as UTF-8 text with the given [key].
+  ///
+  /// The text is encoded into the buffer passed to the native layer.
+  ///
+  /// Throws an [ArgumentError] if [value] is empty; empty values cannot be
+  /// stored.
+  /// Throws an exception if the storage is not initialized or if the operation fails.
+  Future<void> putString(String key, String value);
+
+  /// Retrieves the UTF-8 text stored with the given [key].
+  ///
+  /// Returns `null` if the key does not exist.
+  ///
+  /// Throws an exception if the storage is not initialized or if decryption fails.
+  Future<String?> getString(String key);
+
+  /// Stores [value] as JSON with the given [key].
+  ///
+  /// [value] must be encodable with `jsonEncode`.
+  ///
+  /// Throws an [ArgumentError] if [value] is `null`, since [getJson] could not
+  /// tell a stored `null` from a missing key. Nested `null`s are fine.
+  /// Throws an exception if the storage is not initialized or if the operation fails.
+  Future<void> putJson(String key, Object? value);
+
+  /// Retrieves and decodes the JSON stored with the given [key].
+  ///
+  /// Returns `null` if the key does not exist. A top-level `null` is never
+  /// stored (see [putJson]), so `null` always means a missing key.
+  ///
+  /// Throws an exception if the storage is not initialized or if decryption fails.
+  Future<Object?> getJson(String key);
+
+  /// Registers [codec] for values of type [T].
+  ///
+  /// Replaces any codec previously registered for [T]. A codec for [String]
+  /// is registered by default.
+  void registerCodec<T>(FipersCodec<T> codec);
+
+  /// Stores [value] with the given [key] using the codec registered for [T].
+  ///
+  /// Throws an [ArgumentError] if no codec is registered for [T] or if the
+  /// codec encodes [value] to zero bytes; empty values cannot be stored.
+  /// Throws an exception if the storage is not initialized or if the operation fails.
+  Future<void> putValue<T>(String key, T value);
+
+  /// Retrieves the value stored with the given [key] using the codec
+  /// registered for [T].
+  ///
+  /// Returns `null` if the key does not exist.
+  ///
+  /// Throws an [ArgumentError] if no codec is registered for [T].
+  /// Throws an exception if the storage is not initialized or if decryption fails.
+  Future<T?> getValue<T>(String key);
+
   /// Deletes the data associated with the given [key].
   ///
   /// Throws an exception if the storage is not initialized or if the operation fails.
@@ -4,6 +4,7 @@ import 'dart:typed_data';
 import 'package:ffi/ffi.dart';
 
 import 'bindings/storage_bindings.dart';
+import 'fipers_codec.dart';
 import 'fipers_interface.dart';
 
 /// {@template fipers_native}
@@ -19,6 +20,9 @@ class FipersNative implements Fipers {
   final _bindings = StorageBindings.instance;
   Pointer? _handle;
   bool _initialized = false;
+  final Map<Type, FipersCodec<Object?>> _codecs = {
+    String: const FipersStringCodec(),
+  };
 
   @override
   Future<void> init(String path, String passphrase) async {
@@ -58,22 +62,60 @@ class FipersNative implements Fipers {
 
   @override
   Future<void> put(String key, Uint8List data) async {
+    _putWith(key, (reserve) {
+      reserve(data.length).setAll(0, data);
+      return data.length;
+    });
+  }
+
+  @override
+  Future<Uint8List?> get(String key) async {
+    return _getWith(key, Uint8List.fromList);
+  }
+
+  void _putWith(String key, int Function(FipersBufferReserver) encode) {
     _ensureInitialized();
 
     final keyPtr = key.toNativeUtf8();
-    final dataPtr = malloc<Uint8>(data.length);
     final errorCodePtr = malloc<Int32>();
+    Pointer<Uint8> dataPtr = nullptr;
+    var reservedLength = -1;
 
     try {
-      // Copy data to native memory
-      dataPtr.asTypedList(data.length).setAll(0, data);
+      // Encode straight into native memory
+      final dataLen = encode((maxLength) {
+        if (reservedLength >= 0) {
+          throw StateError('Codec reserved more than one buffer');
+        }
+        if (maxLength < 0) {
+          throw RangeError.range(maxLength, 0, null, 'maxLength');
+        }
+        dataPtr = malloc<Uint8>(maxLength == 0 ? 1 : maxLength);
+        reservedLength = maxLength;
+        return dataPtr.asTypedList(maxLength);
+      });
+
+      // Never let native code read outside the reserved buffer
+      if (reservedLength < 0) {
+        throw StateError('Codec did not reserve a buffer for key: $key');
+      }
+      if (dataLen < 0 || dataLen > reservedLength) {
+        throw StateError(
+          'Codec wrote $dataLen bytes into a $reservedLength-byte buffer '
+          'for key: $key',
+        );
+      }
+      // Native storage rejects empty payloads and reads them back as null
+      if (dataLen == 0) {
+        throw ArgumentError('Cannot store an empty value for key: $key');
+      }
 
       final success =
           _bindings.fipersPut(
             _handle!,
             keyPtr,
             dataPtr,
-            data.length,
+            dataLen,
             errorCodePtr,
           ) !=
           0;
@@ -84,13 +126,14 @@ class FipersNative implements Fipers {
       }
     } finally {
       malloc.free(keyPtr);
-      malloc.free(dataPtr);
+      if (dataPtr != nullptr) {
+        malloc.free(dataPtr);
+      }
       malloc.free(errorCodePtr);
     }
   }
 
-  @override
-  Future<Uint8List?> get(String key) async {
+  T? _getWith<T>(String key, T Function(Uint8List bytes) decode) {
     _ensureInitialized();
 
     final keyPtr = key.toNativeUtf8();
@@ -125,18 +168,21 @@ class FipersNative implements Fipers {
       final dataPtr = outDataPtr.value;
       final dataLen = outLenPtr.value;
 
-      if (dataPtr == nullptr || dataLen == 0) {
+      if (dataPtr == nullptr) {
         return null;
       }
 
-      // Copy data from native memory
-      final data = Uint8List(dataLen);
-      data.setAll(0, dataPtr.asTypedList(dataLen));
-
-      // Free native memory
-      _bindings.fipersFreeData(dataPtr);
+      try {
+        if (dataLen == 0) {
+          return null;
+        }
 
-      return data;
+        // Decode straight from native memory
+        return decode(dataPtr.asTypedList(dataLen));
+      } finally {
+        // Free native memory
+        _bindings.fipersFreeData(dataPtr);
+      }
     } finally {
       malloc.free(keyPtr);
       malloc.free(outDataPtr);
@@ -183,6 +229,60 @@ class FipersNative implements Fipers {
     _initialized = false;
   }
 
+  @override
+  Future<void> putString(String key, String value) async {
+    _putWith(
+      key,
+      (reserve) => const FipersStringCodec().encode(value, reserve),
+    );
+  }
+
+  @override
+  Future<String?> getString(String key) async {
+    return _getWith(key, const FipersStringCodec().decode);
+  }
+
+  @override
+  Future<void> putJson(String key, Object? value) async {
+    if (value == null) {
+      // getJson could not tell a stored null from a missing key
+      throw ArgumentError.notNull('value');
+    }
+    _putWith(
+      key,
+      (reserve) => const FipersJsonCodec().encode(value, reserve),
+    );
+  }
+
+  @override
+  Future<Object?> getJson(String key) async {
+    return _getWith(key, const FipersJsonCodec().decode);
+  }
+
+  @override
+  void registerCodec<T>(FipersCodec<T> codec) {
+    _codecs[T] = codec;
+  }
+
+  @override
+  Future<void> putValue<T>(String key, T value) async {
+    final codec = _codecFor<T>();
+    _putWith(key, (reserve) => codec.encode(value, reserve));
+  }
+
+  @override
+  Future<T?> getValue<T>(String key) async {
+    return _getWith(key, _codecFor<T>().decode);
+  }
+
+  FipersCodec<T> _codecFor<T>() {
+    final codec = _codecs[T];
+    if (codec == null) {
+      throw ArgumentError('No codec registered for type $T');
+    }
+    return codec as FipersCodec<T>;
+  }
+
   void _ensureInitialized() {
     if (!_initialized || _handle == null) {
       throw StateError('Fipers is not initialized. Call init() first.');
@@ -1,5 +1,6 @@
 import 'dart:typed_data';
 
+import 'fipers_codec.dart';
 import 'fipers_interface.dart';
 
 /// Stub implementation for unsupported platforms
@@ -26,6 +27,41 @@ class FipersStub implements Fipers {
     throw UnsupportedError('Not supported');
   }
 
+  @override
+  Future<void> putString(String key, String value) async {
+    throw UnsupportedError('Not supported');
+  }
+
+  @override
+  Future<String?> getString(String key) async {
+    throw UnsupportedError('Not supported');
+  }
+
+  @override
+  Future<void> putJson(String key, Object? value) async {
+    throw UnsupportedError('Not supported');
+  }
+
+  @override
+  Future<Object?> getJson(String key) async {
+    throw UnsupportedError('Not supported');
+  }
+
+  @override
+  void registerCodec<T>(FipersCodec<T> codec) {
+    throw UnsupportedError('Not supported');
+  }
+
+  @override
+  Future<void> putValue<T>(String key, T value) async {
+    throw UnsupportedError('Not supported');
+  }
+
+  @override
+  Future<T?> getValue<T>(String key) async {
+    throw UnsupportedError('Not supported');
+  }
+
   @override
   Future<void> delete(String key) async {
     throw UnsupportedError('Not supported');
@@ -1,7 +1,10 @@
+import 'dart:convert';
+import 'dart:ffi';
 import 'dart:io';
 import 'dart:math';
 import 'dart:typed_data';
 
+import 'package:ffi/ffi.dart';
 import 'package:fipers/fipers.dart';
 import 'package:flutter_test/flutter_test.dart';
 
@@ -237,6 +240,76 @@ void main() {
       print('\n');
     });
   });
+
+  _encodeBenchmarks();
+}
+
+/// Micro-benchmark for encoding text into a native buffer.
+///
+/// Isolates the encode step from encryption and file I/O:
+/// `utf8.encode` + copy vs [FipersStringCodec] writing into the buffer.
+void _encodeBenchmarks() {
+  group('String encode into native buffer (no encryption/I/O)', () {
+    const iterations = 20000;
+    const warmupIterations = 2000;
+
+    int encodeBaseline(String text) {
+      final bytes = utf8.encode(text);
+      final ptr = malloc<Uint8>(bytes.length);
+      ptr.asTypedList(bytes.length).setAll(0, bytes);
+      malloc.free(ptr);
+      return bytes.length;
+    }
+
+    int encodeCodec(String text) {
+      Pointer<Uint8> ptr = nullptr;
+      final length = const FipersStringCodec().encode(text, (maxLength) {
+        ptr = malloc<Uint8>(maxLength);
+        return ptr.asTypedList(maxLength);
+      });
+      malloc.free(ptr);
+      return length;
+    }
+
+    void runEncodeBenchmark(String label, String text) {
+      for (int i = 0; i < warmupIterations; i++) {
+        encodeBaseline(text);
+        encodeCodec(text);
+      }
+
+      // Alternate the two paths so drift affects both equally
+      final baseline = Stopwatch();
+      final codec = Stopwatch();
+      for (int i = 0; i < iterations; i++) {
+        baseline.start();
+        encodeBaseline(text);
+        baseline.stop();
+
+        codec.start();
+        encodeCodec(text);
+        codec.stop();
+      }
+
+      final totalMB = (iterations * utf8.encode(text).length) / (1024 * 1024);
+      final baselineThroughput = totalMB / (baseline.elapsedMicroseconds / 1000000); // MB/s
+      final codecThroughput = totalMB / (codec.elapsedMicroseconds / 1000000); // MB/s
+
+      print('\n=== Encode: $label (${utf8.encode(text).length} bytes) ===');
+      print('utf8.encode + copy: ${baselineThroughput.toStringAsFixed(2)} MB/s');
+      print('FipersStringCodec:  ${codecThroughput.toStringAsFixed(2)} MB/s');
+      print('Ratio (codec / baseline): ${(codecThroughput / baselineThroughput).toStringAsFixed(2)}x');
+
+      expect(encodeCodec(text), equals(encodeBaseline(text)));
+    }
+
+    test('Encode: ASCII text (~1KB)', () {
+      runEncodeBenchmark('ASCII', 'Lorem ipsum dolor sit amet, consectetur. ' * 25);
+    });
+
+    test('Encode: multi-byte text (~1KB)', () {
+      runEncodeBenchmark('multi-byte', 'Lorem ipsum çok güzel 日本語 🚀 ' * 25);
+    });
+  });
 }
 
 /// Benchmark result data class
@@ -0,0 +1,80 @@
+import 'dart:convert';
+import 'dart:typed_data';
+
+import 'package:fipers/fipers.dart';
+import 'package:flutter_test/flutter_test.dart';
+
+void main() {
+  group('FipersStringCodec', () {
+    const codec = FipersStringCodec();
+
+    Uint8List encode(String value) {
+      late Uint8List buffer;
+      final length = codec.encode(value, (maxLength) {
+        buffer = Uint8List(maxLength);
+        return buffer;
+      });
+      return Uint8List.sublistView(buffer, 0, length);
+    }
+
+    test('encodes the same bytes as utf8.encode', () {
+      const samples = [
+        '',
+        'Hello, World!',
+        'çok güzel',
+        '日本語テキスト',
+        'emoji 🚀 and 👍🏽',
+      ];
+
+      for (final sample in samples) {
+        expect(encode(sample), equals(utf8.encode(sample)));
+      }
+    });
+
+    test('replaces unpaired surrogates like utf8.encode', () {
+      const sample = 'a\uD800b\uDC00c';
+      expect(encode(sample), equals(utf8.encode(sample)));
+    });
+
+    test('reserves exactly the encoded length', () {
+      const samples = ['plain ascii', 'çok güzel', 'emoji 🚀', 'a\uD800b'];
+
+      for (final sample in samples) {
+        late int reserved;
+        codec.encode(sample, (maxLength) {
+          reserved = maxLength;
+          return Uint8List(maxLength);
+        });
+        expect(reserved, equals(utf8.encode(sample).length));
+      }
+    });
+
+    test('decodes what it encodes', () {
+      const sample = 'Lorem ipsum 🚀 çok güzel';
+      expect(codec.decode(encode(sample)), equals(sample));
+    });
+  });
+
+  group('FipersJsonCodec', () {
+    const codec = FipersJsonCodec();
+
+    test('round-trips JSON values', () {
+      final value = {
+        'id': 1,
+        'name': 'fipers',
+        'tags': ['a', 'b'],
+        'nested': {'ok': true},
+      };
+
+      late Uint8List buffer;
+      final length = codec.encode(value, (maxLength) {
+        buffer = Uint8List(maxLength);
+        return buffer;
+      });
+
+      final bytes = Uint8List.sublistView(buffer, 0, length);
+      expect(bytes, equals(utf8.encode(jsonEncode(value))));
+      expect(codec.decode(bytes), equals(value));
+    });
+  });
+}
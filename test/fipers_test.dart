@@ -34,12 +34,126 @@ void main() {
       await fipers.put('testkey', data);
       
       final retrieved = await fipers.get('testkey');
-      // Note: Currently returns null as storage is placeholder
-      // In production, this should return the data
+      expect(retrieved, equals(data));
       
       await fipers.close();
     });
 
+    test('putString and getString round-trip text', () async {
+      final fipers = createFipers();
+      await fipers.init('/tmp/test', 'testpass');
+
+      await fipers.putString('textkey', 'Hello, Fipers 🚀');
+      expect(await fipers.getString('textkey'), equals('Hello, Fipers 🚀'));
+
+      await fipers.close();
+    });
+
+    test('putString rejects empty strings', () async {
+      final fipers = createFipers();
+      await fipers.init('/tmp/test', 'testpass');
+
+      await expectLater(
+        fipers.putString('emptykey', ''),
+        throwsA(isA<ArgumentError>()),
+      );
+      expect(await fipers.getString('emptykey'), isNull);
+
+      await fipers.close();
+    });
+
+    test('putJson and getJson round-trip JSON values', () async {
+      final fipers = createFipers();
+      await fipers.init('/tmp/test', 'testpass');
+
+      final value = {
+        'id': 7,
+        'name': 'fipers',
+        'tags': ['a', 'b'],
+        'nested': {'enabled': true},
+      };
+      await fipers.putJson('jsonkey', value);
+      expect(await fipers.getJson('jsonkey'), equals(value));
+
+      await fipers.close();
+    });
+
+    test('putJson rejects a top-level null', () async {
+      final fipers = createFipers();
+      await fipers.init('/tmp/test', 'testpass');
+
+      await expectLater(
+        fipers.putJson('nulljsonkey', null),
+        throwsA(isA<ArgumentError>()),
+      );
+      expect(await fipers.getJson('nulljsonkey'), isNull);
+
+      await fipers.close();
+    });
+
+    test('registerCodec enables putValue and getValue', () async {
+      final fipers = createFipers();
+      await fipers.init('/tmp/test', 'testpass');
+
+      final date = DateTime.utc(2024, 5, 17, 12, 30);
+      fipers.registerCodec(const _DateTimeCodec());
+      await fipers.putValue('datekey', date);
+      expect(await fipers.getValue<DateTime>('datekey'), equals(date));
+
+      await fipers.close();
+    });
+
+    test('registerCodec replaces an existing codec', () async {
+      final fipers = createFipers();
+      await fipers.init('/tmp/test', 'testpass');
+
+      fipers.registerCodec<String>(const _ReversedStringCodec());
+      await fipers.putValue('reversedkey', 'abc');
+
+      expect(await fipers.getValue<String>('reversedkey'), equals('abc'));
+      expect(await fipers.getString('reversedkey'), equals('cba'));
+
+      await fipers.close();
+    });
+
+    test('putValue rejects codecs that overrun the reserved buffer', () async {
+      final fipers = createFipers();
+      await fipers.init('/tmp/test', 'testpass');
+
+      fipers.registerCodec<int>(const _OverrunCodec());
+      await expectLater(
+        fipers.putValue('overrunkey', 1),
+        throwsA(isA<StateError>()),
+      );
+
+      await fipers.close();
+    });
+
+    test('putValue rejects codecs that never reserve a buffer', () async {
+      final fipers = createFipers();
+      await fipers.init('/tmp/test', 'testpass');
+
+      fipers.registerCodec<int>(const _NoReserveCodec());
+      await expectLater(
+        fipers.putValue('noreservekey', 1),
+        throwsA(isA<StateError>()),
+      );
+
+      await fipers.close();
+    });
+
+    test('getValue throws for unregistered type', () async {
+      final fipers = createFipers();
+      await fipers.init('/tmp/test', 'testpass');
+
+      await expectLater(
+        fipers.getValue<DateTime>('datekey'),
+        throwsA(isA<ArgumentError>()),
+      );
+
+      await fipers.close();
+    });
+
     test('delete works correctly', () async {
       final fipers = createFipers();
       await fipers.init('/tmp/test', 'testpass');
@@ -63,3 +177,52 @@ void main() {
     });
   });
 }
+
+class _DateTimeCodec extends FipersCodec<DateTime> {
+  const _DateTimeCodec();
+
+  @override
+  int encode(DateTime value, FipersBufferReserver reserve) =>
+      const FipersStringCodec().encode(value.toIso8601String(), reserve);
+
+  @override
+  DateTime decode(Uint8List bytes) =>
+      DateTime.parse(const FipersStringCodec().decode(bytes));
+}
+
+class _ReversedStringCodec extends FipersCodec<String> {
+  const _ReversedStringCodec();
+
+  @override
+  int encode(String value, FipersBufferReserver reserve) =>
+      const FipersStringCodec().encode(_reverse(value), reserve);
+
+  @override
+  String decode(Uint8List bytes) =>
+      _reverse(const FipersStringCodec().decode(bytes));
+
+  static String _reverse(String value) => value.split('').reversed.join();
+}
+
+class _OverrunCodec extends FipersCodec<int> {
+  const _OverrunCodec();
+
+  @override
+  int encode(int value, FipersBufferReserver reserve) {
+    reserve(1)[0] = value;
+    return 64;
+  }
+
+  @override
+  int decode(Uint8List bytes) => bytes[0];
+}
+
+class _NoReserveCodec extends FipersCodec<int> {
+  const _NoReserveCodec();
+
+  @override
+  int encode(int value, FipersBufferReserver reserve) => 1;
+
+  @override
+  int decode(Uint8List bytes) => bytes[0];
+}
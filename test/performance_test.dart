@@ -332,6 +332,123 @@ void main() {
       expect(elapsed, lessThan(5000), reason: 'String operations should be fast');
     });
 
+    test('String Codec Performance vs utf8.encode + put', () async {
+      await fipers.init(testStoragePath, 'test-passphrase');
+
+      const itemCount = 200;
+      const warmupCount = 20;
+      final text = 'Lorem ipsum dolor sit amet, çok güzel 🚀 ' * 25; // ~1KB
+
+      // Baseline: utf8.encode -> Uint8List -> native copy (and back)
+      Future<void> baselineRound(int i) async {
+        final data = utf8.encode(text);
+        await fipers.put('bytes-key-$i', data);
+        final retrieved = await fipers.get('bytes-key-$i');
+        expect(utf8.decode(retrieved!), equals(text));
+      }
+
+      // Codec: UTF-8 written into / read from native memory directly
+      Future<void> codecRound(int i) async {
+        await fipers.putString('string-key-$i', text);
+        final retrieved = await fipers.getString('string-key-$i');
+        expect(retrieved, equals(text));
+      }
+
+      // Warm up both paths so neither runs on cold storage or JIT
+      for (int i = 0; i < warmupCount; i++) {
+        await baselineRound(-1 - i);
+        await codecRound(-1 - i);
+      }
+
+      // Alternate the two paths so drift affects both equally
+      final baseline = Stopwatch();
+      final codec = Stopwatch();
+      for (int i = 0; i < itemCount; i++) {
+        baseline.start();
+        await baselineRound(i);
+        baseline.stop();
+
+        codec.start();
+        await codecRound(i);
+        codec.stop();
+      }
+
+      final totalKB = (itemCount * utf8.encode(text).length) / 1024;
+      final baselineThroughput =
+          totalKB / (baseline.elapsedMicroseconds / 1000000); // KB/s
+      final codecThroughput =
+          totalKB / (codec.elapsedMicroseconds / 1000000); // KB/s
+
+      print('utf8.encode + put/get (200 items) time: ${baseline.elapsedMilliseconds}ms');
+      print('utf8.encode + put/get throughput: ${baselineThroughput.toStringAsFixed(2)} KB/s');
+      print('putString/getString (200 items) time: ${codec.elapsedMilliseconds}ms');
+      print('putString/getString throughput: ${codecThroughput.toStringAsFixed(2)} KB/s');
+
+      // Report the ratio instead of asserting it; wall-clock ratios are too
+      // noisy on shared runners to gate the suite
+      print('putString/getString vs baseline throughput ratio: ${(codecThroughput / baselineThroughput).toStringAsFixed(2)}x');
+
+      expect(codec.elapsedMilliseconds, lessThan(30000), reason: 'String codec operations should be fast');
+    });
+
+    test('JSON Codec Performance vs jsonEncode + put', () async {
+      await fipers.init(testStoragePath, 'test-passphrase');
+
+      const itemCount = 200;
+      const warmupCount = 20;
+      final value = {
+        'id': 42,
+        'name': 'Fipers',
+        'tags': List.generate(20, (i) => 'tag-$i'),
+        'nested': {'enabled': true, 'ratio': 0.75},
+      };
+
+      Future<void> baselineRound(int i) async {
+        final data = utf8.encode(jsonEncode(value));
+        await fipers.put('json-bytes-key-$i', data);
+        final retrieved = await fipers.get('json-bytes-key-$i');
+        expect(jsonDecode(utf8.decode(retrieved!)), equals(value));
+      }
+
+      Future<void> codecRound(int i) async {
+        await fipers.putJson('json-key-$i', value);
+        final retrieved = await fipers.getJson('json-key-$i');
+        expect(retrieved, equals(value));
+      }
+
+      for (int i = 0; i < warmupCount; i++) {
+        await baselineRound(-1 - i);
+        await codecRound(-1 - i);
+      }
+
+      final baseline = Stopwatch();
+      final codec = Stopwatch();
+      for (int i = 0; i < itemCount; i++) {
+        baseline.start();
+        await baselineRound(i);
+        baseline.stop();
+
+        codec.start();
+        await codecRound(i);
+        codec.stop();
+      }
+
+      final totalKB = (itemCount * utf8.encode(jsonEncode(value)).length) / 1024;
+      final baselineThroughput =
+          totalKB / (baseline.elapsedMicroseconds / 1000000); // KB/s
+      final codecThroughput =
+          totalKB / (codec.elapsedMicroseconds / 1000000); // KB/s
+
+      print('jsonEncode + put/get (200 items) time: ${baseline.elapsedMilliseconds}ms');
+      print('jsonEncode + put/get throughput: ${baselineThroughput.toStringAsFixed(2)} KB/s');
+      print('putJson/getJson (200 items) time: ${codec.elapsedMilliseconds}ms');
+      print('putJson/getJson throughput: ${codecThroughput.toStringAsFixed(2)} KB/s');
+
+      print('putJson/getJson vs baseline throughput ratio: ${(codecThroughput / baselineThroughput).toStringAsFixed(2)}x');
+
+      expect(codec.elapsedMilliseconds, lessThan(30000), reason: 'JSON codec operations should be fast');
+    });
+
     test('Concurrent Operations Performance', () async {
       await fipers.init(testStoragePath, 'test-passphrase');
 